@@ -1,16 +1,25 @@
 import sys
 import os
+import random
+from functools import lru_cache
+from string import Template
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, 
                             QHBoxLayout, QWidget, QLabel, QComboBox, QSlider, 
                             QCheckBox, QProgressBar, QStyle, QFileDialog, QRadioButton,
-                            QButtonGroup, QLineEdit, QGroupBox, QTextEdit, QScrollArea,
-                            QSplitter, QFrame, QListWidget, QListWidgetItem, QToolButton)
-from PyQt5.QtCore import Qt, QSize, QTimer
-from PyQt5.QtGui import QFont, QIcon, QColor, QPalette, QPixmap
+                            QButtonGroup, QLineEdit, QGroupBox, QPlainTextEdit, QScrollArea,
+                            QSplitter, QFrame, QListView, QToolButton)
+from PyQt5.QtCore import Qt, QSize, QTimer, QEvent, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QFont, QIcon, QColor, QPalette, QPixmap, QTextCursor
+
+# Common languages offered in the language selector, as (code, name) pairs
+LANGUAGES = (
+    ("en", "English"), ("fr", "French"), ("de", "German"), ("es", "Spanish"), ("it", "Italian"),
+    ("ja", "Japanese"), ("zh", "Chinese"), ("ru", "Russian"), ("ko", "Korean")
+)
 
 # Custom styles and colors
 class StyleSheet:
-    # Color scheme
+    # Color scheme (the default theme)
     PRIMARY = "#1976D2"
     PRIMARY_HOVER = "#1565C0"
     PRIMARY_ACTIVE = "#0D47A1"
@@ -34,153 +43,210 @@ class StyleSheet:
     BORDER = "#D1D5DB"
     FOCUS_BORDER = "#3B82F6"
     
-    # Main application stylesheet
-    MAIN_STYLE = f"""
-        QMainWindow {{
-            background-color: {BG_LIGHT};
-        }}
-        QLabel {{
-            color: {TEXT_PRIMARY};
-        }}
-        QLabel[heading=true] {{
+    DEFAULT_THEME = {
+        "PRIMARY": PRIMARY, "PRIMARY_HOVER": PRIMARY_HOVER, "PRIMARY_ACTIVE": PRIMARY_ACTIVE,
+        "SECONDARY": SECONDARY, "SECONDARY_HOVER": SECONDARY_HOVER, "SECONDARY_ACTIVE": SECONDARY_ACTIVE,
+        "BG_LIGHT": BG_LIGHT, "PANEL_BG": PANEL_BG, "PANEL_BG_ALT": PANEL_BG_ALT,
+        "TEXT_PRIMARY": TEXT_PRIMARY, "TEXT_SECONDARY": TEXT_SECONDARY, "TEXT_INACTIVE": TEXT_INACTIVE,
+        "SUCCESS": SUCCESS, "WARNING": WARNING, "ERROR": ERROR, "INFO": INFO,
+        "BORDER": BORDER, "FOCUS_BORDER": FOCUS_BORDER,
+    }
+    
+    # Main application stylesheet template, filled in per theme (see build_style)
+    # (plain window/text colors live in the palette below, not here)
+    MAIN_TEMPLATE = Template("""
+        QLabel[heading=true] {
             font-weight: bold;
             font-size: 14px;
             margin-bottom: 5px;
             padding-bottom: 2px;
-            border-bottom: 1px solid {BORDER};
-        }}
-        QPushButton {{
-            background-color: {PRIMARY};
+            border-bottom: 1px solid $BORDER;
+        }
+        QPushButton {
+            background-color: $PRIMARY;
             color: white;
             border: none;
             padding: 8px 16px;
             border-radius: 4px;
             font-weight: bold;
-        }}
-        QPushButton:hover {{
-            background-color: {PRIMARY_HOVER};
-        }}
-        QPushButton:pressed {{
-            background-color: {PRIMARY_ACTIVE};
-        }}
-        QPushButton[secondary=true] {{
-            background-color: {SECONDARY};
-        }}
-        QPushButton[secondary=true]:hover {{
-            background-color: {SECONDARY_HOVER};
-        }}
-        QPushButton[secondary=true]:pressed {{
-            background-color: {SECONDARY_ACTIVE};
-        }}
-        QPushButton:disabled {{
-            background-color: {TEXT_INACTIVE};
-        }}
-        QGroupBox {{
-            background-color: {PANEL_BG};
+        }
+        QPushButton:hover {
+            background-color: $PRIMARY_HOVER;
+        }
+        QPushButton:pressed {
+            background-color: $PRIMARY_ACTIVE;
+        }
+        QPushButton[secondary=true] {
+            background-color: $SECONDARY;
+        }
+        QPushButton[secondary=true]:hover {
+            background-color: $SECONDARY_HOVER;
+        }
+        QPushButton[secondary=true]:pressed {
+            background-color: $SECONDARY_ACTIVE;
+        }
+        QPushButton:disabled {
+            background-color: $TEXT_INACTIVE;
+        }
+        QGroupBox {
+            background-color: $PANEL_BG;
             border-radius: 6px;
-            border: 1px solid {BORDER};
+            border: 1px solid $BORDER;
             margin-top: 16px;
             font-weight: bold;
             padding-top: 22px;
-        }}
-        QGroupBox::title {{
+        }
+        QGroupBox::title {
             subcontrol-origin: margin;
             subcontrol-position: top center;
             padding: 0 5px;
-            color: {TEXT_PRIMARY};
-        }}
-        QLineEdit, QComboBox, QTextEdit {{
-            border: 1px solid {BORDER};
+            color: $TEXT_PRIMARY;
+        }
+        QLineEdit, QComboBox, QPlainTextEdit {
+            border: 1px solid $BORDER;
             border-radius: 4px;
             padding: 6px;
-            background-color: {PANEL_BG};
-        }}
-        QLineEdit:focus, QComboBox:focus, QTextEdit:focus {{
-            border: 1px solid {FOCUS_BORDER};
-        }}
-        QProgressBar {{
-            border: 1px solid {BORDER};
+            background-color: $PANEL_BG;
+        }
+        QLineEdit:focus, QComboBox:focus, QPlainTextEdit:focus {
+            border: 1px solid $FOCUS_BORDER;
+        }
+        QProgressBar {
+            border: 1px solid $BORDER;
             border-radius: 4px;
             text-align: center;
-            background-color: {PANEL_BG_ALT};
-        }}
-        QProgressBar::chunk {{
-            background-color: {PRIMARY};
+            background-color: $PANEL_BG_ALT;
+        }
+        QProgressBar::chunk {
+            background-color: $PRIMARY;
             border-radius: 3px;
-        }}
-        QSlider::groove:horizontal {{
-            border: 1px solid {BORDER};
+        }
+        QProgressBar[level="low"]::chunk {
+            background-color: $SUCCESS;
+        }
+        QProgressBar[level="medium"]::chunk {
+            background-color: $WARNING;
+        }
+        QProgressBar[level="high"]::chunk {
+            background-color: $ERROR;
+        }
+        QSlider::groove:horizontal {
+            border: 1px solid $BORDER;
             height: 6px;
-            background: {PANEL_BG_ALT};
+            background: $PANEL_BG_ALT;
             margin: 0px;
             border-radius: 3px;
-        }}
-        QSlider::handle:horizontal {{
-            background: {PRIMARY};
+        }
+        QSlider::handle:horizontal {
+            background: $PRIMARY;
             border: none;
             width: 16px;
             height: 16px;
             margin: -5px 0;
             border-radius: 8px;
-        }}
-        QSlider::sub-page:horizontal {{
-            background: {PRIMARY};
+        }
+        QSlider::sub-page:horizontal {
+            background: $PRIMARY;
             border-radius: 3px;
-        }}
-        QCheckBox {{
+        }
+        QCheckBox {
             spacing: 5px;
-        }}
-        QCheckBox::indicator {{
+        }
+        QCheckBox::indicator {
             width: 18px;
             height: 18px;
-            border: 1px solid {BORDER};
+            border: 1px solid $BORDER;
             border-radius: 3px;
-        }}
-        QCheckBox::indicator:checked {{
-            background-color: {PRIMARY};
-            border: 1px solid {PRIMARY};
+        }
+        QCheckBox::indicator:checked {
+            background-color: $PRIMARY;
+            border: 1px solid $PRIMARY;
             image: url(check.png);
-        }}
-        QRadioButton {{
+        }
+        QRadioButton {
             spacing: 5px;
-        }}
-        QRadioButton::indicator {{
+        }
+        QRadioButton::indicator {
             width: 18px;
             height: 18px;
-            border: 1px solid {BORDER};
+            border: 1px solid $BORDER;
             border-radius: 9px;
-        }}
-        QRadioButton::indicator:checked {{
-            background-color: {PRIMARY};
-            border: 1px solid {PRIMARY};
+        }
+        QRadioButton::indicator:checked {
+            background-color: $PRIMARY;
+            border: 1px solid $PRIMARY;
             width: 10px;
             height: 10px;
             border-radius: 5px;
-        }}
-        QListWidget {{
-            border: 1px solid {BORDER};
+        }
+        QListView {
+            border: 1px solid $BORDER;
             border-radius: 4px;
-            background-color: {PANEL_BG};
-        }}
-        QListWidget::item {{
+            background-color: $PANEL_BG;
+        }
+        QListView::item {
             padding: 5px;
-            border-bottom: 1px solid {PANEL_BG_ALT};
-        }}
-        QListWidget::item:selected {{
-            background-color: {PRIMARY};
+            border-bottom: 1px solid $PANEL_BG_ALT;
+        }
+        QListView::item:selected {
+            background-color: $PRIMARY;
             color: white;
-        }}
-    """
+        }
+    """)
+    
+    # Stylesheet for the default theme, rendered once and shared
+    MAIN_STYLE = MAIN_TEMPLATE.substitute(DEFAULT_THEME)
+    
+    @staticmethod
+    def build_palette():
+        """Build the palette for color-only rules the stylesheet doesn't need to handle"""
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor(StyleSheet.BG_LIGHT))
+        palette.setColor(QPalette.WindowText, QColor(StyleSheet.TEXT_PRIMARY))
+        palette.setColor(QPalette.Base, QColor(StyleSheet.PANEL_BG))
+        palette.setColor(QPalette.Text, QColor(StyleSheet.TEXT_PRIMARY))
+        palette.setColor(QPalette.Highlight, QColor(StyleSheet.PRIMARY))
+        palette.setColor(QPalette.HighlightedText, QColor("white"))
+        return palette
+
+@lru_cache(maxsize=4)
+def _render_style(theme_items):
+    return StyleSheet.MAIN_TEMPLATE.substitute(dict(theme_items))
+
+def build_style(**overrides):
+    """Render the main stylesheet with some theme colors replaced, e.g. build_style(PRIMARY="#8E24AA")"""
+    if not overrides:
+        return StyleSheet.MAIN_STYLE
+    return _render_style(frozenset({**StyleSheet.DEFAULT_THEME, **overrides}.items()))
+
+class SessionModel(QAbstractListModel):
+    """List model for session history; views only query the rows they display"""
+    def __init__(self, sessions=None, parent=None):
+        super().__init__(parent)
+        self.sessions = list(sessions or [])
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.sessions)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.sessions[index.row()]
+        return None
 
 class ImprovedSpeechToTextApp(QMainWindow):
+    # Audio level refresh intervals (ms) for foreground and background windows
+    AUDIO_INTERVAL_ACTIVE = 100
+    AUDIO_INTERVAL_INACTIVE = 250
+    RESOURCE_INTERVAL = 1000
+    
+    # Standard style icons, shared across instances and rebuilds
+    ICON_CACHE = {}
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Speech to Text Typer")
         self.setMinimumSize(900, 700)
         
-        # Apply stylesheet
-        self.setStyleSheet(StyleSheet.MAIN_STYLE)
-        
         # Initialize central widget and main layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -213,12 +279,66 @@ class ImprovedSpeechToTextApp(QMainWindow):
         
         # Create status bar
         self.statusBar().showMessage("Ready to transcribe. Click START or press Alt+S to begin")
+        self.pending_status = None  # Latest (panel, status bar) text, see set_status
+        
+        # Bound once so the simulated readouts don't look up random.randint every tick
+        self.randint = random.randint
         
         # Set up timer for audio level simulation (will be replaced with actual audio data)
+        # The timer only runs while the window is shown (see showEvent/hideEvent)
+        # and slows down while the window is in the background (see changeEvent)
         self.audio_timer = QTimer()
+        self.audio_timer.setInterval(self.AUDIO_INTERVAL_ACTIVE)
         self.audio_timer.timeout.connect(self.update_audio_level)
-        self.audio_timer.start(100)
         
+        # CPU/memory readouts only need human-readable refresh rates
+        self.resource_timer = QTimer()
+        self.resource_timer.setInterval(self.RESOURCE_INTERVAL)
+        self.resource_timer.timeout.connect(self.update_resources)
+        
+    def start_update_timers(self):
+        """Start the periodic audio level and resource updates"""
+        self.audio_timer.start()
+        self.resource_timer.start()
+    
+    def stop_update_timers(self):
+        """Stop the periodic audio level and resource updates"""
+        self.audio_timer.stop()
+        self.resource_timer.stop()
+    
+    def showEvent(self, event):
+        """Resume periodic updates when the window becomes visible"""
+        super().showEvent(event)
+        self.start_update_timers()
+    
+    def hideEvent(self, event):
+        """Pause periodic updates while the window is hidden"""
+        super().hideEvent(event)
+        self.stop_update_timers()
+    
+    def changeEvent(self, event):
+        """Throttle audio level updates while the window is in the background or minimized"""
+        super().changeEvent(event)
+        if event.type() == QEvent.ActivationChange:
+            if self.isActiveWindow():
+                self.audio_timer.setInterval(self.AUDIO_INTERVAL_ACTIVE)
+            else:
+                self.audio_timer.setInterval(self.AUDIO_INTERVAL_INACTIVE)
+        elif event.type() == QEvent.WindowStateChange:
+            # Not every platform sends a hide event on minimize, so check explicitly
+            if self.windowState() & Qt.WindowMinimized:
+                self.stop_update_timers()
+            elif self.isVisible():
+                self.start_update_timers()
+    
+    def standard_icon(self, standard_pixmap):
+        """Return a cached QStyle standard icon"""
+        icon = self.ICON_CACHE.get(standard_pixmap)
+        if icon is None:
+            icon = self.style().standardIcon(standard_pixmap)
+            self.ICON_CACHE[standard_pixmap] = icon
+        return icon
+    
     def setup_header(self):
         header_layout = QHBoxLayout()
         
@@ -236,12 +356,21 @@ class ImprovedSpeechToTextApp(QMainWindow):
         transcription_layout = QVBoxLayout()
         transcription_group.setLayout(transcription_layout)
         
-        # Transcription text area
-        self.transcription_text = QTextEdit()
+        # Transcription text area (plain text: line-based layout, capped history)
+        self.transcription_text = QPlainTextEdit()
         self.transcription_text.setReadOnly(True)
+        self.transcription_text.setMaximumBlockCount(2000)
         self.transcription_text.setPlaceholderText("Transcribed text will appear here...")
         self.transcription_text.setMinimumHeight(150)
         
+        # Incoming text is queued and flushed in one edit, so a burst of
+        # segments costs a single document layout instead of one per line
+        self.pending_text = []
+        self.text_flush_timer = QTimer()
+        self.text_flush_timer.setSingleShot(True)
+        self.text_flush_timer.setInterval(30)
+        self.text_flush_timer.timeout.connect(self.flush_transcription)
+        
         transcription_layout.addWidget(self.transcription_text)
         
         # Add to top layout
@@ -258,18 +387,18 @@ class ImprovedSpeechToTextApp(QMainWindow):
         
         # Start button
         self.start_button = QPushButton("START")
-        self.start_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.start_button.setIcon(self.standard_icon(QStyle.SP_MediaPlay))
         self.start_button.clicked.connect(self.toggle_listening)
         
         # Pause button
         self.pause_button = QPushButton("PAUSE")
-        self.pause_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+        self.pause_button.setIcon(self.standard_icon(QStyle.SP_MediaPause))
         self.pause_button.clicked.connect(self.toggle_pause)
         self.pause_button.setEnabled(False)
         
         # Stop button
         self.stop_button = QPushButton("STOP")
-        self.stop_button.setIcon(self.style().standardIcon(QStyle.SP_MediaStop))
+        self.stop_button.setIcon(self.standard_icon(QStyle.SP_MediaStop))
         self.stop_button.clicked.connect(self.stop_listening)
         self.stop_button.setEnabled(False)
         
@@ -284,6 +413,8 @@ class ImprovedSpeechToTextApp(QMainWindow):
         self.audio_level_progress = QProgressBar()
         self.audio_level_progress.setRange(0, 100)
         self.audio_level_progress.setValue(0)
+        self.audio_level_bucket = None  # Color band currently applied to the chunk
+        self.last_audio_level = None  # Value currently shown by the bar
         
         audio_level_layout.addWidget(audio_level_label)
         audio_level_layout.addWidget(self.audio_level_progress)
@@ -369,9 +500,8 @@ class ImprovedSpeechToTextApp(QMainWindow):
         model_settings_layout.addWidget(device_label)
         model_settings_layout.addWidget(self.device_combo)
         
-        # Connect signals
+        # Connect signals (the radios are exclusive, so one toggled signal covers both)
         self.download_radio.toggled.connect(self.toggle_model_source)
-        self.local_radio.toggled.connect(self.toggle_model_source)
         self.browse_button.clicked.connect(self.browse_local_model)
         
         # Add to bottom layout
@@ -386,16 +516,13 @@ class ImprovedSpeechToTextApp(QMainWindow):
         # Language selection
         language_label = QLabel("🗣️ Language:")
         self.language_combo = QComboBox()
-        self.language_combo.addItem("Auto Detect", "auto")
-        
-        # Add common languages
-        language_names = {
-            "en": "English", "fr": "French", "de": "German", "es": "Spanish", "it": "Italian",
-            "ja": "Japanese", "zh": "Chinese", "ru": "Russian", "ko": "Korean"
-        }
         
-        for code, name in language_names.items():
+        # Populate with signals blocked so the combo settles once, not per item
+        self.language_combo.blockSignals(True)
+        self.language_combo.addItem("Auto Detect", "auto")
+        for code, name in LANGUAGES:
             self.language_combo.addItem(f"{name} ({code})", code)
+        self.language_combo.blockSignals(False)
         
         language_layout.addWidget(language_label)
         language_layout.addWidget(self.language_combo)
@@ -445,9 +572,10 @@ class ImprovedSpeechToTextApp(QMainWindow):
         
         # Session history
         history_label = QLabel("🕒 Last Session:")
-        self.history_list = QListWidget()
         dummy_sessions = ["14:22 - Meeting notes", "13:05 - Email draft", "09:30 - Code comments"]
-        self.history_list.addItems(dummy_sessions)
+        self.history_list = QListView()
+        self.history_list.setUniformItemSizes(True)
+        self.history_list.setModel(SessionModel(dummy_sessions, self.history_list))
         
         status_layout.addWidget(history_label)
         status_layout.addWidget(self.history_list)
@@ -528,24 +656,65 @@ class ImprovedSpeechToTextApp(QMainWindow):
     
     def update_audio_level(self):
         """Simulate audio level updates (will be replaced with actual levels)"""
-        import random
-        level = random.randint(0, 100)
+        self.set_audio_level(self.randint(0, 100))
+    
+    def update_resources(self):
+        """Simulate CPU and memory readouts (will be replaced with actual usage)"""
+        cpu_text = f"{self.randint(20, 40)}%"
+        memory_text = f"{self.randint(300, 500)} MB"
+        
+        # Skip the label relayout when the displayed text hasn't changed
+        if cpu_text != self.cpu_value.text():
+            self.cpu_value.setText(cpu_text)
+        if memory_text != self.memory_value.text():
+            self.memory_value.setText(memory_text)
+    
+    def set_audio_level(self, level):
+        """Show an audio level (0-100); connect an audio source's level signal here"""
+        if level == self.last_audio_level:
+            return
+        self.last_audio_level = level
         self.audio_level_progress.setValue(level)
         
-        # Update color based on level
-        if level < 30:
-            self.audio_level_progress.setStyleSheet(f"QProgressBar::chunk {{ background-color: {StyleSheet.SUCCESS}; }}")
-        elif level < 70:
-            self.audio_level_progress.setStyleSheet(f"QProgressBar::chunk {{ background-color: {StyleSheet.WARNING}; }}")
-        else:
-            self.audio_level_progress.setStyleSheet(f"QProgressBar::chunk {{ background-color: {StyleSheet.ERROR}; }}")
-        
-        # Update CPU and memory (simulation)
-        cpu = random.randint(20, 40)
-        memory = random.randint(300, 500)
-        
-        self.cpu_value.setText(f"{cpu}%")
-        self.memory_value.setText(f"{memory} MB")
+        # Only restyle the chunk when the level crosses into a different color band
+        bucket = "low" if level < 30 else "medium" if level < 70 else "high"
+        if bucket == self.audio_level_bucket:
+            return
+        self.audio_level_bucket = bucket
+        
+        # Update color based on level: the colors live in MAIN_STYLE as
+        # QProgressBar[level=...] rules, so only this widget needs re-polishing
+        self.audio_level_progress.setProperty("level", bucket)
+        style = self.audio_level_progress.style()
+        style.unpolish(self.audio_level_progress)
+        style.polish(self.audio_level_progress)
+    
+    def append_transcription(self, text):
+        """Queue a line of transcribed text for the next batched flush"""
+        self.pending_text.append(text)
+        if not self.text_flush_timer.isActive():
+            self.text_flush_timer.start()
+    
+    def flush_transcription(self):
+        """Append all queued lines to the transcription view in a single edit block"""
+        if not self.pending_text:
+            return
+        
+        scrollbar = self.transcription_text.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        
+        cursor = QTextCursor(self.transcription_text.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        if not self.transcription_text.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText("\n".join(self.pending_text))
+        cursor.endEditBlock()
+        self.pending_text.clear()
+        
+        # Keep following new text, like append() does, if the view was at the end
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
     
     def toggle_listening(self):
         """Start or stop listening"""
@@ -556,11 +725,10 @@ class ImprovedSpeechToTextApp(QMainWindow):
             self.pause_button.setEnabled(True)
             self.stop_button.setEnabled(True)
             self.model_status_value.setText("Loaded")
-            self.status_message.setText("✅ Status: Listening...")
-            self.statusBar().showMessage("Listening... Speak now!")
+            self.set_status("✅ Status: Listening...", "Listening... Speak now!")
             
             # Add demo text (will be replaced with actual transcription)
-            self.transcription_text.append("I'm currently listening to what you're saying and transcribing it in real-time.")
+            self.append_transcription("I'm currently listening to what you're saying and transcribing it in real-time.")
         else:
             self.stop_listening()
     
@@ -568,12 +736,10 @@ class ImprovedSpeechToTextApp(QMainWindow):
         """Pause or resume listening"""
         if self.pause_button.text() == "PAUSE":
             self.pause_button.setText("RESUME")
-            self.status_message.setText("⏸️ Status: Paused")
-            self.statusBar().showMessage("Transcription paused")
+            self.set_status("⏸️ Status: Paused", "Transcription paused")
         else:
             self.pause_button.setText("PAUSE")
-            self.status_message.setText("✅ Status: Listening...")
-            self.statusBar().showMessage("Listening... Speak now!")
+            self.set_status("✅ Status: Listening...", "Listening... Speak now!")
     
     def stop_listening(self):
         """Stop listening and reset UI"""
@@ -582,8 +748,20 @@ class ImprovedSpeechToTextApp(QMainWindow):
         self.pause_button.setText("PAUSE")
         self.pause_button.setEnabled(False)
         self.stop_button.setEnabled(False)
-        self.status_message.setText("Status: Ready")
-        self.statusBar().showMessage("Ready to transcribe. Click START or press Alt+S to begin")
+        self.set_status("Status: Ready", "Ready to transcribe. Click START or press Alt+S to begin")
+    
+    def set_status(self, message, bar_message):
+        """Queue a status panel/status bar update; several calls in one event show only the last"""
+        if self.pending_status is None:
+            QTimer.singleShot(0, self.apply_status)
+        self.pending_status = (message, bar_message)
+    
+    def apply_status(self):
+        """Show the most recently queued status"""
+        message, bar_message = self.pending_status
+        self.pending_status = None
+        self.status_message.setText(message)
+        self.statusBar().showMessage(bar_message)
     
     def toggle_auto_type(self, state):
         """Toggle auto-typing functionality"""
@@ -597,10 +775,18 @@ class ImprovedSpeechToTextApp(QMainWindow):
         """Test keyboard input functionality"""
         self.statusBar().showMessage("Testing typing functionality...")
         print("Testing keyboard input...")
-        self.transcription_text.append("This is a test of the typing functionality.")
+        self.append_transcription("This is a test of the typing functionality.")
 
 if __name__ == "__main__":
+    # Application attributes must be set before the QApplication exists
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents)
     app = QApplication(sys.argv)
+    
+    # Apply palette and stylesheet once for the whole application
+    app.setPalette(StyleSheet.build_palette())
+    app.setStyleSheet(StyleSheet.MAIN_STYLE)
+    
     window = ImprovedSpeechToTextApp()
     window.show()
     sys.exit(app.exec_()) 
\ No newline at end of file
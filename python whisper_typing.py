@@ -1,11 +1,17 @@
 import sounddevice as sd
 import numpy as np
 import queue
+import ctranslate2
 from faster_whisper import WhisperModel
 from pynput.keyboard import Controller
 
+# Pick the device: ctranslate2 (installed with faster-whisper) reports visible GPUs.
+# On CUDA, int8 weights with float16 activations beat plain int8.
+device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+compute_type = "int8_float16" if device == "cuda" else "int8"
+
 # Load the Faster Whisper model
-model = WhisperModel("distil-large-v3", device="cuda" or "cpu", compute_type="int8")
+model = WhisperModel("distil-large-v3", device=device, compute_type=compute_type)
 
 # Keyboard controller to simulate typing
 keyboard = Controller()
@@ -14,6 +20,8 @@ audio_queue = queue.Queue()
 # Audio settings
 SAMPLE_RATE = 16000  # Whisper model sample rate
 BLOCKSIZE = 4000     # Smaller blocks reduce latency
+SILENCE_RMS = 0.01   # Blocks below this RMS are treated as silence
+MIN_SPEECH_SAMPLES = SAMPLE_RATE  # Collect ~1 s of speech before transcribing
 
 def callback(indata, frames, time, status):
     """Callback function to put audio data into the queue."""
@@ -22,13 +30,32 @@ def callback(indata, frames, time, status):
     audio_queue.put(indata.copy())
 
 # Start recording
-with sd.InputStream(samplerate=SAMPLE_RATE, channels=1, callback=callback):
+with sd.InputStream(samplerate=SAMPLE_RATE, channels=1, blocksize=BLOCKSIZE, callback=callback):
     print("Listening... Speak now!")
 
+    speech_blocks = []
+    speech_samples = 0
+
     while True:
         audio_chunk = audio_queue.get()
         audio_data = np.squeeze(audio_chunk)
 
+        # Cheap energy gate: drop silent blocks instead of running the model on them
+        rms = np.sqrt(np.dot(audio_data, audio_data) / audio_data.size)
+        if rms >= SILENCE_RMS:
+            speech_blocks.append(audio_data)
+            speech_samples += audio_data.size
+            # Keep collecting until there is enough speech for a useful pass
+            if speech_samples < MIN_SPEECH_SAMPLES:
+                continue
+        elif not speech_blocks:
+            continue
+
+        # Either ~1 s of speech is buffered or silence ended an utterance
+        audio_data = np.concatenate(speech_blocks)
+        speech_blocks = []
+        speech_samples = 0
+
         # Transcribe speech
         segments, _ = model.transcribe(audio_data, beam_size=5)
 
@@ -0,0 +1,65 @@
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PyQt5")
+whisper_typing = pytest.importorskip("whisper_typing")
+
+
+class Segment:
+    def __init__(self, text):
+        self.text = text
+
+
+class BlockingModel:
+    """Stands in for WhisperModel: transcribe() waits until the test releases it"""
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def transcribe(self, audio, **kwargs):
+        self.started.set()
+        self.release.wait(timeout=5)
+        return [Segment("stale words")], None
+
+
+class RecordingKeyboard:
+    def __init__(self):
+        self.typed = []
+
+    def type(self, text):
+        self.typed.append(text)
+
+
+def test_stop_then_start_drops_in_flight_transcription():
+    thread = whisper_typing.AudioTranscriptionThread()
+    thread.model = BlockingModel()
+    thread.keyboard = RecordingKeyboard()
+    thread.vad_enabled = False
+    thread.type_delay_pending = False
+    emitted = []
+    thread.transcription_done.connect(emitted.append)
+
+    # A buffer from the first run is being transcribed...
+    thread.running = True
+    audio = np.full(thread.chunk_size, 0.1, dtype=np.float32)
+    job = threading.Thread(target=thread.transcribe_audio, args=(audio, thread.run_generation))
+    job.start()
+    assert thread.model.started.wait(timeout=5)
+
+    # ...when the user presses Stop and then Start again
+    thread.stop()
+    thread.running = True
+
+    thread.model.release.set()
+    job.join(timeout=5)
+
+    assert not job.is_alive()
+    assert thread.keyboard.typed == []
+    assert emitted == []
+    assert thread.context_window == []
@@ -1,10 +1,12 @@
 import sys
 import sounddevice as sd
 import numpy as np
-import queue
 import threading
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
+from functools import lru_cache
+import ctranslate2
 from faster_whisper import WhisperModel
 from pynput.keyboard import Controller
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, 
@@ -13,11 +15,46 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout
                             QButtonGroup, QLineEdit, QGroupBox)
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
 from PyQt5.QtGui import QFont, QIcon
-import scipy.signal as signal
 
 # English only - remove other language codes
 ENGLISH_CODE = "en"
 
+# Common Whisper hallucinations (based on research), built once rather than per segment
+HALLUCINATION_PATTERNS = frozenset({
+    "Thank you.",
+    "Thank you",
+    "Thank you very much.",
+    "Thanks for watching.",
+    "Thanks for watching",
+    "Please subscribe",
+    "Like and subscribe",
+    "Don't forget to subscribe"
+})
+HALLUCINATION_KEYWORDS = ("thank", "thanks", "please", "subscribe")
+
+# Transcription parameters for English only, built once rather than per flush
+# (treat as read-only; the prompt is passed separately per call)
+TRANSCRIPTION_KWARGS = {
+    'beam_size': 1,             # Greedy decoding for realtime transcription
+    'vad_filter': True,
+    'vad_parameters': {'min_silence_duration_ms': 300},
+    'language': ENGLISH_CODE,   # Always use English
+    'temperature': 0.0,         # Use greedy decoding for more exact transcriptions
+    'repetition_penalty': 1.5,  # Penalize repeating the same phrases
+    'no_speech_threshold': 0.6, # Higher threshold to avoid "no speech" false positives
+    'suppress_tokens': [-1],    # Suppress blank tokens
+    'suppress_blank': True,     # Suppress blank outputs
+    'without_timestamps': True  # Disable timestamps to reduce "thank you" hallucinations
+}
+
+# High quality mode: beam search plus more parameters
+HIGH_QUALITY_TRANSCRIPTION_KWARGS = {
+    **TRANSCRIPTION_KWARGS,
+    'beam_size': 8,
+    'condition_on_previous_text': True,  # Use previous text as context
+    'best_of': 3                         # Generate multiple candidates and pick the best one
+}
+
 def find_local_model():
     """Search the models directory for valid model directories."""
     models_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models")
@@ -35,10 +72,35 @@ def find_local_model():
     
     return None
 
+@lru_cache(maxsize=2)
+def load_whisper_model(model, device, compute_type):
+    """Load a WhisperModel, reusing the instance for repeated identical settings.
+    
+    `model` is a model size or a local model path. Only two are kept since each
+    holds its weights in memory.
+    """
+    return WhisperModel(model, device=device, compute_type=compute_type)
+
+def default_compute_type():
+    """Default precision: int8_float16 when a CUDA GPU is available, int8 otherwise.
+    
+    On a GPU plain int8 is slower than tensor-core float16 matmuls; int8_float16
+    keeps int8 weights in VRAM but computes in float16.
+    """
+    return "int8_float16" if ctranslate2.get_cuda_device_count() > 0 else "int8"
+
+def create_combo_box(items, default):
+    """Create a combo box populated with items and default selected, without emitting change signals."""
+    combo = QComboBox()
+    combo.blockSignals(True)
+    combo.addItems(items)
+    combo.setCurrentText(default)
+    combo.blockSignals(False)
+    return combo
+
 class AudioTranscriptionThread(QThread):
     transcription_done = pyqtSignal(str)
     status_update = pyqtSignal(str)
-    audio_level_update = pyqtSignal(float)
     
     def __init__(self, model_size="distil-large-v3", device="auto", compute_type="int8", model_path=None, parent=None):
         super().__init__(parent)
@@ -48,17 +110,25 @@ class AudioTranscriptionThread(QThread):
         self.model_path = model_path
         self.running = False
         self.paused = False
-        self.audio_queue = queue.Queue()
         self.keyboard = Controller()
         self.auto_type = True
+        self.type_delay_pending = True  # Short pause before the first typed text
         self.sample_rate = 16000
         self.model = None
-        self.debug = True
+        self.debug = False  # Diagnostics (and their per-chunk stats) only when enabled in the UI
         
         # Improved Audio processing parameters
         self.chunk_size = 4000  # Reduced for more frequent processing
-        self.audio_buffer = []  # Store audio chunks for processing
         self.buffer_max_size = 3  # Reduced for more responsive transcription
+        # Chunks collected for processing are copied into persistent buffers; a
+        # flush hands a view of its first buffered_chunks rows to the transcription
+        # worker. There are two so one can be collected while the other is transcribed.
+        self.audio_scratch = np.empty((2, self.buffer_max_size, self.chunk_size), dtype=np.float32)
+        self.scratch_index = 0  # Buffer currently being collected
+        self.scratch_futures = [None, None]  # Pending transcription of each buffer
+        self.buffered_chunks = 0
+        self.transcribe_executor = None
+        self.run_generation = 0  # Bumped by stop(); jobs from an earlier run must not emit or type
         self.trigger_level = 0.02  # Increased threshold for better signal-to-noise ratio
         self.silence_chunks = 0  # Count consecutive silent chunks
         self.max_silence_chunks = 5  # Maximum silent chunks before forcing processing
@@ -77,29 +147,21 @@ class AudioTranscriptionThread(QThread):
         self.energy_threshold = 0.005  # Minimum energy for audio to be considered speech
         self.dynamic_energy = True  # Adjust energy threshold dynamically
         
-    def update_model(self, model_size, device, compute_type, model_path=None):
-        self.model_size = model_size
-        self.device = device
-        self.compute_type = compute_type
-        self.model_path = model_path
-        
-        model_info = self.model_path if self.model_path else model_size
-        self.status_update.emit(f"Loading model: {model_info}...")
+        # Preallocated ring of fixed block-sized slots (~30 s) written by the audio
+        # callback, so no per-block array is allocated on the audio thread.
+        # Single producer (callback) / single consumer (run loop): the callback
+        # only advances ring_head and the run loop only advances ring_tail, so the
+        # two counters need no lock; slot = counter % ring_slots. The event wakes
+        # the consumer when a block arrives.
+        self.ring_slots = (self.sample_rate * 30) // self.chunk_size
+        self.ring_buffer = np.empty((self.ring_slots, self.chunk_size), dtype=np.float32)
+        self.ring_head = 0  # Blocks written
+        self.ring_tail = 0  # Blocks consumed
+        self.ring_levels = [0.0] * self.ring_slots  # Audio level of each slot's block
+        self.audio_ready = threading.Event()
+        self.level_scratch = np.empty(self.chunk_size, dtype=np.float32)  # |samples| for the level
+        self.latest_level = 0.0  # Level of the most recent block, read by the UI
         
-        # Load model in a separate thread to prevent UI freezing
-        def load_model():
-            try:
-                self.model = WhisperModel(
-                    model_path if model_path else model_size, 
-                    device=device, 
-                    compute_type=compute_type
-                )
-                self.status_update.emit("Model loaded successfully!")
-            except Exception as e:
-                self.status_update.emit(f"Error loading model: {str(e)}")
-                
-        threading.Thread(target=load_model).start()
-    
     def set_initial_prompt(self, prompt):
         """Set initial prompt to guide transcription"""
         self.initial_prompt = prompt
@@ -118,20 +180,21 @@ class AudioTranscriptionThread(QThread):
     def preprocess_audio(self, audio_data):
         """Apply preprocessing to improve audio quality before transcription"""
         if not self.noise_reduction_enabled:
-            return audio_data.astype(np.float32)
+            return audio_data.astype(np.float32, copy=False)
         
         try:
-            # Ensure audio is float32
-            audio_data = audio_data.astype(np.float32)
+            # Ensure audio is float32 (no copy if it already is)
+            audio_data = audio_data.astype(np.float32, copy=False)
             
-            # Apply pre-emphasis to enhance high frequencies (improves speech clarity)
-            emphasized_audio = np.append(
-                audio_data[0], 
-                audio_data[1:] - self.pre_emphasis * audio_data[:-1]
-            )
+            # Apply pre-emphasis to enhance high frequencies (improves speech clarity),
+            # writing straight into one output buffer instead of building temporaries
+            emphasized_audio = np.empty_like(audio_data)
+            emphasized_audio[0] = audio_data[0]
+            np.multiply(audio_data[:-1], -self.pre_emphasis, out=emphasized_audio[1:])
+            emphasized_audio[1:] += audio_data[1:]
             
             # Calculate energy of signal
-            energy = np.sum(emphasized_audio ** 2) / len(emphasized_audio)
+            energy = np.dot(emphasized_audio, emphasized_audio) / len(emphasized_audio)
             
             # Dynamically adjust energy threshold if enabled
             if self.dynamic_energy and energy > self.energy_threshold:
@@ -139,15 +202,16 @@ class AudioTranscriptionThread(QThread):
                 self.energy_threshold = 0.9 * self.energy_threshold + 0.1 * energy
             
             # Apply normalization (more controlled approach)
-            if np.max(np.abs(emphasized_audio)) > 0:
-                emphasized_audio = emphasized_audio / (np.max(np.abs(emphasized_audio)) + 1e-8)
+            peak = np.max(np.abs(emphasized_audio))
+            if peak > 0:
+                emphasized_audio /= (peak + 1e-8)
                 
             # Return processed audio
-            return emphasized_audio.astype(np.float32)
+            return emphasized_audio
             
         except Exception as e:
             print(f"Error in audio preprocessing: {e}")
-            return audio_data.astype(np.float32)
+            return audio_data.astype(np.float32, copy=False)
     
     def is_speech(self, audio_data):
         """Better voice activity detection to filter out silence and background noise"""
@@ -200,21 +264,133 @@ class AudioTranscriptionThread(QThread):
         return f"{base_prompt} Previous context: {context}"
         
     def callback(self, indata, frames, time, status):
-        """Callback function to put audio data into the queue."""
+        """Callback function to write audio data into the ring buffer."""
         if status:
             print(f"Audio callback status: {status}")
         
-        # Calculate audio level and emit signal
-        audio_level = np.abs(indata).mean()
-        self.audio_level_update.emit(audio_level)
+        # Calculate audio level once per block (abs into a reusable buffer); the UI
+        # polls latest_level at its own refresh rate instead of receiving a signal per block
+        magnitudes = self.level_scratch[:frames]
+        np.abs(indata[:, 0], out=magnitudes)
+        audio_level = float(magnitudes.mean())
+        self.latest_level = audio_level
         
-        # Debug audio levels to check if microphone is working
-        if self.debug and audio_level > 0.01:  # Only print if there's significant audio
-            print(f"Audio level: {audio_level:.4f}")
-                
+        # No debug printing here: this runs on the realtime audio thread and a
+        # blocking print can cause dropouts (the level meter shows the same value)
         if not self.paused and self.running:
-            self.audio_queue.put(indata.copy())
+            # Copy the block into the next slot, then publish it
+            # (the stream's blocksize makes every block exactly one slot)
+            slot = self.ring_head % self.ring_slots
+            np.copyto(self.ring_buffer[slot], indata[:, 0])
+            self.ring_levels[slot] = audio_level
+            self.ring_head += 1
+            self.audio_ready.set()
     
+    def transcribe_audio(self, audio_data, generation):
+        """Transcribe one flushed buffer and emit/type the text (runs on the transcription worker)
+        
+        `generation` is the run_generation the buffer was recorded in; once stop()
+        has moved past it the result is dropped.
+        """
+        if generation != self.run_generation:
+            return
+        
+        try:
+            # Debug: Print audio data shape and values
+            if self.debug:
+                print(f"Processing audio chunk: shape={audio_data.shape}, min={audio_data.min():.4f}, max={audio_data.max():.4f}, mean={audio_data.mean():.4f}")
+            
+            # Check if this might be speech using VAD
+            if not self.is_speech(audio_data):
+                if self.debug:
+                    print("Skipping chunk - no speech detected")
+                return
+            
+            # Keep a copy of the original audio for fallback
+            original_audio = audio_data.astype(np.float32)
+            
+            # Preprocess audio for better quality
+            processed_audio = self.preprocess_audio(audio_data)
+            
+            # Transcribe speech with enhanced parameters for English only
+            if self.high_quality_mode:
+                transcription_kwargs = HIGH_QUALITY_TRANSCRIPTION_KWARGS
+            else:
+                transcription_kwargs = TRANSCRIPTION_KWARGS
+            
+            # Add context from previous transcriptions (None keeps faster-whisper's default)
+            effective_prompt = self.get_context_prompt() or None
+            
+            try:
+                # First try with processed audio
+                segments, info = self.model.transcribe(processed_audio, initial_prompt=effective_prompt, **transcription_kwargs)
+                
+                if self.debug:
+                    print(f"Transcribing with English language model")
+            
+            except Exception as e:
+                # If processing fails, try with original audio
+                print(f"Transcription with processed audio failed: {e}")
+                print("Falling back to original audio...")
+                try:
+                    segments, info = self.model.transcribe(original_audio, initial_prompt=effective_prompt, **transcription_kwargs)
+                    
+                    if self.debug:
+                        print(f"Fallback succeeded. Detected language: {info.language} with probability {info.language_probability:.2f}")
+                except Exception as e2:
+                    print(f"Fallback transcription also failed: {e2}")
+                    # Give up on this audio chunk
+                    return
+            
+            # Stopped (and maybe restarted) while transcribing: drop the stale result
+            if generation != self.run_generation:
+                return
+            
+            # Process the transcribed text
+            texts = []
+            for segment in segments:
+                text = segment.text.strip()
+                
+                # Apply hallucination correction
+                text = self.correct_hallucinations(text)
+                
+                if text:
+                    texts.append(text)
+                    
+                    # Update context window for future transcriptions
+                    self.context_window.append(text)
+                    if len(self.context_window) > self.max_context_window:
+                        self.context_window.pop(0)  # Remove oldest context
+            
+            # Emit and type the whole chunk at once rather than per segment
+            transcribed_text = " ".join(texts)
+            if transcribed_text:
+                self.transcription_done.emit(transcribed_text)
+                
+                # Type out the recognized text if auto-type is enabled (and still current)
+                if self.auto_type and generation == self.run_generation:
+                    if self.debug:
+                        print(f"Typing text: '{transcribed_text}'")
+                    try:
+                        # Give the target window a moment only for the first text after (re)starting
+                        if self.type_delay_pending:
+                            time.sleep(0.1)
+                            self.type_delay_pending = False
+                        self.keyboard.type(transcribed_text + " ")
+                    except Exception as e:
+                        print(f"Error typing text: {e}")
+            
+            # Print if no text was transcribed
+            if not transcribed_text and self.debug:
+                print("No text transcribed from audio chunk")
+                # Check if audio level was too low
+                if audio_data.mean() < 0.01:
+                    print("Audio level may be too low - speak louder or adjust microphone")
+        except Exception as e:
+            print(f"Error transcribing audio: {e}")
+            import traceback
+            traceback.print_exc()
+
     def run(self):
         self.running = True
         self.status_update.emit("Loading model...")
@@ -222,38 +398,67 @@ class AudioTranscriptionThread(QThread):
         try:
             # Only load the model if it's not already loaded
             if self.model is None:
-                self.status_update.emit("Creating new model instance...")
-                self.model = WhisperModel(
+                self.status_update.emit("Loading model instance...")
+                self.model = load_whisper_model(
                     self.model_path if self.model_path else self.model_size, 
-                    device=self.device, 
-                    compute_type=self.compute_type
+                    self.device, 
+                    self.compute_type
                 )
             
-            self.status_update.emit("Model loaded. Starting audio stream...")
+            # Report what CTranslate2 actually runs (e.g. "auto" device resolved)
+            model_device = getattr(self.model.model, "device", self.device)
+            model_compute_type = getattr(self.model.model, "compute_type", self.compute_type)
+            self.status_update.emit(f"Model loaded ({model_compute_type} on {model_device}). Starting audio stream...")
+            
+            # A transcription from the previous run may still be finishing; it reads
+            # the scratch buffers and the context window, so let it end first
+            # (in short steps, so a stop() meanwhile is still noticed quickly)
+            previous = [future for future in self.scratch_futures if future is not None]
+            while self.running and not all(future.done() for future in previous):
+                futures_wait(previous, timeout=0.1)
+            generation = self.run_generation
             
             # Clear the audio buffer and reset counters
-            self.audio_buffer = []
+            self.buffered_chunks = 0
+            self.scratch_index = 0
+            self.scratch_futures = [None, None]
             self.silence_chunks = 0
+            self.ring_head = 0
+            self.ring_tail = 0
+            self.type_delay_pending = True
+            self.audio_ready.clear()
             
-            with sd.InputStream(samplerate=self.sample_rate, channels=1, blocksize=self.chunk_size, callback=self.callback):
+            # Single worker, so buffers are transcribed (and typed) in order
+            self.transcribe_executor = ThreadPoolExecutor(max_workers=1)
+            
+            # Pin the stream format to mono float32 so blocks go into the ring without conversion
+            with sd.InputStream(samplerate=self.sample_rate, channels=1, dtype=np.float32, blocksize=self.chunk_size, callback=self.callback):
                 self.status_update.emit("Listening... Speak now!")
                 
                 while self.running:
                     try:
-                        # Use a timeout to allow checking the running flag periodically
-                        audio_chunk = self.audio_queue.get(timeout=0.5)
+                        if self.ring_tail == self.ring_head:
+                            # Sleep until a block arrives; stop() also sets the event
+                            self.audio_ready.wait()
+                            self.audio_ready.clear()
+                            continue
+                        # If we fell a whole ring behind, the oldest slots were overwritten
+                        self.ring_tail = max(self.ring_tail, self.ring_head - self.ring_slots)
+                        slot = self.ring_tail % self.ring_slots
+                        self.ring_tail += 1
                         if not self.paused:
-                            # Add the chunk to our buffer
-                            self.audio_buffer.append(audio_chunk)
+                            # Copy the chunk out of the ring into our buffer
+                            np.copyto(self.audio_scratch[self.scratch_index, self.buffered_chunks], self.ring_buffer[slot])
+                            self.buffered_chunks += 1
                             
-                            # Calculate audio level
-                            audio_level = np.abs(audio_chunk).mean()
+                            # Audio level already computed by the callback
+                            audio_level = self.ring_levels[slot]
                             
                             # Determine if we should process now
                             process_now = False
                             
                             # 1. Check if we have enough chunks
-                            buffer_full = len(self.audio_buffer) >= self.buffer_max_size
+                            buffer_full = self.buffered_chunks >= self.buffer_max_size
                             
                             # 2. Check if audio is loud enough to trigger immediate processing
                             loud_audio = audio_level > self.trigger_level * 3
@@ -264,120 +469,31 @@ class AudioTranscriptionThread(QThread):
                             else:
                                 self.silence_chunks = 0
                                 
-                            force_process = self.silence_chunks >= self.max_silence_chunks and len(self.audio_buffer) > 1
+                            force_process = self.silence_chunks >= self.max_silence_chunks and self.buffered_chunks > 1
                             
                             # Decide whether to process now
                             process_now = buffer_full or loud_audio or force_process
                             
                             if process_now:
-                                # Combine all buffered chunks
-                                combined_chunks = np.vstack(self.audio_buffer) if len(self.audio_buffer) > 1 else self.audio_buffer[0]
-                                audio_data = np.squeeze(combined_chunks)
+                                # The buffered chunks are contiguous rows: a flat view, no copy
+                                audio_data = self.audio_scratch[self.scratch_index, :self.buffered_chunks].reshape(-1)
                                 
                                 # Reset buffer and silence counter
-                                self.audio_buffer = []
+                                self.buffered_chunks = 0
                                 self.silence_chunks = 0
                                 
-                                # Debug: Print audio data shape and values
-                                if self.debug:
-                                    print(f"Processing audio chunk: shape={audio_data.shape}, min={audio_data.min():.4f}, max={audio_data.max():.4f}, mean={audio_data.mean():.4f}")
-                                
-                                # Check if this might be speech using VAD
-                                if not self.is_speech(audio_data):
-                                    if self.debug:
-                                        print("Skipping chunk - no speech detected")
-                                    continue
-                                
-                                # Keep a copy of the original audio for fallback
-                                original_audio = audio_data.copy().astype(np.float32)
-                                
-                                # Preprocess audio for better quality
-                                processed_audio = self.preprocess_audio(audio_data)
-                                
-                                # Transcribe speech with enhanced parameters for English only
-                                transcription_kwargs = {
-                                    'beam_size': 5 if not self.high_quality_mode else 8,
-                                    'vad_filter': True,
-                                    'vad_parameters': dict(min_silence_duration_ms=300),
-                                    'language': ENGLISH_CODE,  # Always use English
-                                    'temperature': 0.0,        # Use greedy decoding for more exact transcriptions
-                                    'repetition_penalty': 1.5, # Penalize repeating the same phrases
-                                    'no_speech_threshold': 0.6, # Higher threshold to avoid "no speech" false positives
-                                    'suppress_tokens': [-1],   # Suppress blank tokens
-                                    'suppress_blank': True,    # Suppress blank outputs
-                                    'without_timestamps': True # Disable timestamps to reduce "thank you" hallucinations
-                                }
+                                # Transcribe on the worker while we keep collecting into the other buffer
+                                self.scratch_futures[self.scratch_index] = self.transcribe_executor.submit(self.transcribe_audio, audio_data, generation)
+                                self.scratch_index ^= 1
                                 
-                                # Add more parameters only in high quality mode
-                                if self.high_quality_mode:
-                                    transcription_kwargs.update({
-                                        'condition_on_previous_text': True,  # Use previous text as context
-                                        'best_of': 3              # Generate multiple candidates and pick the best one
-                                    })
-                                    
-                                # Add context from previous transcriptions
-                                effective_prompt = self.get_context_prompt()
-                                if effective_prompt:
-                                    transcription_kwargs['initial_prompt'] = effective_prompt
+                                # The other buffer may still be queued for transcription; wait before
+                                # overwriting it (blocks keep landing in the ring meanwhile). Wait in
+                                # short steps so stop() is noticed within ~0.1 s; the loop then exits
+                                # without touching the busy buffer.
+                                pending = self.scratch_futures[self.scratch_index]
+                                while pending is not None and self.running and not pending.done():
+                                    futures_wait([pending], timeout=0.1)
                                 
-                                try:
-                                    # First try with processed audio
-                                    segments, info = self.model.transcribe(processed_audio, **transcription_kwargs)
-                                    
-                                    if self.debug:
-                                        print(f"Transcribing with English language model")
-                                    
-                                except Exception as e:
-                                    # If processing fails, try with original audio
-                                    print(f"Transcription with processed audio failed: {e}")
-                                    print("Falling back to original audio...")
-                                    try:
-                                        segments, info = self.model.transcribe(original_audio, **transcription_kwargs)
-                                        
-                                        if self.debug:
-                                            print(f"Fallback succeeded. Detected language: {info.language} with probability {info.language_probability:.2f}")
-                                    except Exception as e2:
-                                        print(f"Fallback transcription also failed: {e2}")
-                                        # Continue to next audio chunk
-                                        continue
-                                
-                                # Process the transcribed text
-                                transcribed_text = ""
-                                for segment in segments:
-                                    text = segment.text.strip()
-                                    
-                                    # Apply hallucination correction
-                                    text = self.correct_hallucinations(text)
-                                    
-                                    if text:
-                                        transcribed_text += text + " "
-                                        self.transcription_done.emit(text)
-                                        
-                                        # Update context window for future transcriptions
-                                        self.context_window.append(text)
-                                        if len(self.context_window) > self.max_context_window:
-                                            self.context_window.pop(0)  # Remove oldest context
-                                        
-                                        # Type out the recognized text if auto-type is enabled
-                                        if self.auto_type:
-                                            if self.debug:
-                                                print(f"Typing text: '{text}'")
-                                            try:
-                                                # Try using a small delay before typing
-                                                time.sleep(0.1)
-                                                self.keyboard.type(text + " ")
-                                            except Exception as e:
-                                                print(f"Error typing text: {e}")
-                                
-                                # Print if no text was transcribed
-                                if not transcribed_text and self.debug:
-                                    print("No text transcribed from audio chunk")
-                                    # Check if audio level was too low
-                                    if audio_data.mean() < 0.01:
-                                        print("Audio level may be too low - speak louder or adjust microphone")
-                                
-                    except queue.Empty:
-                        continue
                     except Exception as e:
                         print(f"Error in transcription loop: {e}")
                         import traceback
@@ -387,15 +503,25 @@ class AudioTranscriptionThread(QThread):
             print(error_msg)
             self.status_update.emit(error_msg)
         finally:
+            # Drop queued transcriptions without waiting, so stop() (which waits for
+            # this thread on the GUI thread) returns promptly; one already in progress
+            # finishes but emits and types nothing (see run_generation), and the
+            # next run() waits for it before reusing the buffers
+            if self.transcribe_executor is not None:
+                self.transcribe_executor.shutdown(wait=False, cancel_futures=True)
             self.status_update.emit("Transcription stopped")
             self.running = False
     
     def stop(self):
         self.running = False
+        self.run_generation += 1
+        self.audio_ready.set()  # Wake the run loop so it sees running is False
         self.wait()
     
     def toggle_pause(self):
         self.paused = not self.paused
+        if not self.paused:
+            self.type_delay_pending = True
         return self.paused
     
     def set_auto_type(self, enabled):
@@ -404,26 +530,14 @@ class AudioTranscriptionThread(QThread):
 
     def correct_hallucinations(self, text):
         """Correct common hallucination patterns in Whisper output"""
-        # Map of common hallucinations and their likely corrections based on research
-        hallucination_patterns = {
-            "Thank you.": "",
-            "Thank you": "",
-            "Thank you very much.": "",
-            "Thanks for watching.": "",
-            "Thanks for watching": "",
-            "Please subscribe": "",
-            "Like and subscribe": "",
-            "Don't forget to subscribe": ""
-        }
-        
         # Check if the output matches any known hallucination patterns
-        if text.strip() in hallucination_patterns:
+        if text.strip() in HALLUCINATION_PATTERNS:
             if self.debug:
                 print(f"Detected hallucination: '{text}' - skipping")
             return ""
             
         # Check if the text is very short and contains only common words
-        if len(text.split()) <= 3 and any(pattern in text.lower() for pattern in ["thank", "thanks", "please", "subscribe"]):
+        if len(text.split()) <= 3 and any(pattern in text.lower() for pattern in HALLUCINATION_KEYWORDS):
             if self.debug:
                 print(f"Detected likely hallucination: '{text}' - skipping")
             return ""
@@ -431,6 +545,67 @@ class AudioTranscriptionThread(QThread):
         return text
 
 class SpeechToTextApp(QMainWindow):
+    # Application-wide stylesheet, installed once on the QApplication
+    APP_STYLE = """
+        QMainWindow {
+            background-color: #ffffff;
+        }
+        QPushButton {
+            background-color: #4CAF50;
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        QPushButton:hover {
+            background-color: #45a049;
+        }
+        QPushButton:disabled {
+            background-color: #cccccc;
+            color: #666666;
+        }
+        QComboBox, QLineEdit {
+            padding: 5px;
+            border: 1px solid #cccccc;
+            border-radius: 3px;
+        }
+        QGroupBox {
+            font-weight: bold;
+            border: 1px solid #cccccc;
+            border-radius: 5px;
+            margin-top: 1ex;
+            padding: 10px;
+        }
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            subcontrol-position: top center;
+            padding: 0 3px;
+        }
+        QProgressBar {
+            border: 1px solid #cccccc;
+            border-radius: 3px;
+            text-align: center;
+        }
+        QProgressBar::chunk {
+            background-color: #4CAF50;
+            width: 1px;
+        }
+        QLabel#englishLabel {
+            font-weight: bold;
+            color: #4CAF50;
+        }
+        QLabel#promptHelp {
+            font-style: italic;
+            color: #666666;
+        }
+        QLabel#transcriptionText {
+            background-color: #f0f0f0;
+            padding: 10px;
+            border-radius: 5px;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Speech to Text Typer (English)")
@@ -442,6 +617,19 @@ class SpeechToTextApp(QMainWindow):
         # Automatically find local model
         self.model_path = find_local_model()
         
+        # Coalesce slider drags into at most one label/status refresh per frame
+        # (the timer is not restarted while pending, so it also fires mid-drag)
+        self.pending_slider_status = None
+        self.slider_refresh_timer = QTimer(self)
+        self.slider_refresh_timer.setSingleShot(True)
+        self.slider_refresh_timer.setInterval(16)
+        self.slider_refresh_timer.timeout.connect(self.refresh_slider_labels)
+        
+        # Poll the audio level at ~30 Hz while listening, however often blocks arrive
+        self.level_timer = QTimer(self)
+        self.level_timer.setInterval(33)
+        self.level_timer.timeout.connect(self.refresh_audio_level)
+        
         # Set up the UI
         self.setup_ui()
         
@@ -514,9 +702,8 @@ class SpeechToTextApp(QMainWindow):
         local_path_layout.addWidget(self.browse_button, 1)
         model_source_layout.addLayout(local_path_layout)
         
-        # Connect radio button signals
+        # Connect radio button signals (the radios are exclusive, so one toggled signal covers both)
         self.download_radio.toggled.connect(self.toggle_model_source)
-        self.local_radio.toggled.connect(self.toggle_model_source)
         
         main_layout.addWidget(model_source_group)
         
@@ -528,9 +715,8 @@ class SpeechToTextApp(QMainWindow):
         # Model selection
         model_layout = QHBoxLayout()
         model_label = QLabel("Model:")
-        self.model_combo = QComboBox()
-        self.model_combo.addItems(["tiny", "base", "small", "medium", "large-v3", "distil-large-v3"])
-        self.model_combo.setCurrentText("small")  # Changed default to small for faster loading
+        # Default to small for faster loading
+        self.model_combo = create_combo_box(["tiny", "base", "small", "medium", "large-v3", "distil-large-v3"], "small")
         model_layout.addWidget(model_label)
         model_layout.addWidget(self.model_combo)
         download_model_layout.addLayout(model_layout)
@@ -538,9 +724,7 @@ class SpeechToTextApp(QMainWindow):
         # Device selection
         device_layout = QHBoxLayout()
         device_label = QLabel("Device:")
-        self.device_combo = QComboBox()
-        self.device_combo.addItems(["cpu", "cuda", "auto"])
-        self.device_combo.setCurrentText("auto")
+        self.device_combo = create_combo_box(["cpu", "cuda", "auto"], "auto")
         device_layout.addWidget(device_label)
         device_layout.addWidget(self.device_combo)
         download_model_layout.addLayout(device_layout)
@@ -548,9 +732,7 @@ class SpeechToTextApp(QMainWindow):
         # Precision selection
         precision_layout = QHBoxLayout()
         precision_label = QLabel("Precision:")
-        self.precision_combo = QComboBox()
-        self.precision_combo.addItems(["float16", "int8"])
-        self.precision_combo.setCurrentText("int8")
+        self.precision_combo = create_combo_box(["float16", "int8_float16", "int8"], default_compute_type())
         precision_layout.addWidget(precision_label)
         precision_layout.addWidget(self.precision_combo)
         download_model_layout.addLayout(precision_layout)
@@ -631,7 +813,7 @@ class SpeechToTextApp(QMainWindow):
         
         # Explain that the app is English-only
         english_label = QLabel("This application is optimized for English speech recognition only.")
-        english_label.setStyleSheet("font-weight: bold; color: #4CAF50;")
+        english_label.setObjectName("englishLabel")
         prompt_layout.addWidget(english_label)
         
         # Initial prompt for better context
@@ -648,7 +830,7 @@ class SpeechToTextApp(QMainWindow):
         # Add help text for prompt
         prompt_help = QLabel("Adding a prompt related to your topic can improve transcription accuracy.")
         prompt_help.setWordWrap(True)
-        prompt_help.setStyleSheet("font-style: italic; color: #666666;")
+        prompt_help.setObjectName("promptHelp")
         prompt_layout.addWidget(prompt_help)
         
         main_layout.addWidget(prompt_group)
@@ -664,7 +846,7 @@ class SpeechToTextApp(QMainWindow):
         
         self.transcription_text = QLabel("")
         self.transcription_text.setWordWrap(True)
-        self.transcription_text.setStyleSheet("background-color: #f0f0f0; padding: 10px; border-radius: 5px;")
+        self.transcription_text.setObjectName("transcriptionText")
         self.transcription_text.setMinimumHeight(60)
         main_layout.addWidget(self.transcription_text)
         
@@ -678,7 +860,7 @@ class SpeechToTextApp(QMainWindow):
         
         # Add debug checkbox
         self.debug_checkbox = QCheckBox("Debug Mode")
-        self.debug_checkbox.setChecked(True)
+        self.debug_checkbox.setChecked(False)
         self.debug_checkbox.stateChanged.connect(self.toggle_debug)
         options_layout.addWidget(self.debug_checkbox)
         
@@ -705,54 +887,6 @@ class SpeechToTextApp(QMainWindow):
         self.test_button = QPushButton("Test Typing")
         self.test_button.clicked.connect(self.test_typing)
         main_layout.addWidget(self.test_button)
-        
-        # Styling
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #ffffff;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            QComboBox, QLineEdit {
-                padding: 5px;
-                border: 1px solid #cccccc;
-                border-radius: 3px;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 3px;
-            }
-            QProgressBar {
-                border: 1px solid #cccccc;
-                border-radius: 3px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                width: 1px;
-            }
-        """)
     
     def toggle_model_source(self):
         """Handle toggling between download and local model sources"""
@@ -766,9 +900,11 @@ class SpeechToTextApp(QMainWindow):
             self.browse_button.setEnabled(True)
             self.download_model_group.setEnabled(False)
             # Restore detected local model path if available
-            if not self.local_path_edit.text() and find_local_model():
-                self.model_path = find_local_model()
-                self.local_path_edit.setText(self.model_path)
+            if not self.local_path_edit.text():
+                local_model = find_local_model()
+                if local_model:
+                    self.model_path = local_model
+                    self.local_path_edit.setText(self.model_path)
     
     def browse_local_model(self):
         """Open file dialog to select local model directory"""
@@ -778,6 +914,10 @@ class SpeechToTextApp(QMainWindow):
             self.model_path = directory
             print(f"Selected local model directory: {directory}")
     
+    def refresh_audio_level(self):
+        """Show the audio thread's latest level (called by level_timer)"""
+        self.update_audio_level(self.audio_thread.latest_level)
+    
     def update_audio_level(self, level):
         """Update the audio level progress bar"""
         # Scale the audio level to the progress bar
@@ -816,7 +956,7 @@ class SpeechToTextApp(QMainWindow):
         # Connect signals
         self.audio_thread.transcription_done.connect(self.update_transcription)
         self.audio_thread.status_update.connect(self.update_status)
-        self.audio_thread.audio_level_update.connect(self.update_audio_level)
+        self.audio_thread.finished.connect(self.level_timer.stop)
         
         # Set debug state
         self.audio_thread.debug = self.debug_checkbox.isChecked()
@@ -866,6 +1006,8 @@ class SpeechToTextApp(QMainWindow):
             slider_value = int(threshold * 200)
             self.mic_sensitivity_slider.setValue(slider_value)
             self.audio_thread.energy_threshold = threshold
+            # Keep the calibration message rather than the slider's queued status
+            self.pending_slider_status = None
             
             self.status_label.setText(f"Microphone calibrated. Threshold set to {threshold:.4f}")
             print(f"Microphone calibrated. Background noise: {energy:.6f}, Threshold: {threshold:.6f}")
@@ -885,7 +1027,11 @@ class SpeechToTextApp(QMainWindow):
             self.pause_button.setEnabled(False)
         else:
             print("Starting audio thread")
-            self.audio_thread.start()
+            # Only a scheduling hint: the transcription worker is spawned from this
+            # thread and gets the same priority, and on Linux with the default
+            # scheduling policy Qt thread priorities have no effect at all
+            self.audio_thread.start(QThread.HighPriority)
+            self.level_timer.start()  # Stopped again when the thread finishes
             self.start_button.setText("Stop Listening")
             self.pause_button.setEnabled(True)
             self.pause_button.setText("Pause")
@@ -949,22 +1095,32 @@ class SpeechToTextApp(QMainWindow):
     
     def update_context_window(self, value):
         """Update the size of the context window"""
-        self.context_value_label.setText(str(value))
         if self.audio_thread:
             self.audio_thread.max_context_window = value
-        self.update_status(f"Context window size set to {value}")
+        self.pending_slider_status = f"Context window size set to {value}"
+        if not self.slider_refresh_timer.isActive():
+            self.slider_refresh_timer.start()
     
     def update_mic_sensitivity(self, value):
         """Update the microphone sensitivity"""
         sensitivity = value / 200  # Scale back to 0.005 to 0.1
         if self.audio_thread:
             self.audio_thread.energy_threshold = sensitivity
+        self.pending_slider_status = f"Microphone sensitivity set to {sensitivity:.3f}"
+        if not self.slider_refresh_timer.isActive():
+            self.slider_refresh_timer.start()
+    
+    def refresh_slider_labels(self):
+        """Update slider value labels and status at most once per frame during slider changes"""
+        self.context_value_label.setText(str(self.context_slider.value()))
         
         # Update the label to show percentage
-        percentage = int((value / 20) * 100)
+        percentage = int((self.mic_sensitivity_slider.value() / 20) * 100)
         self.mic_sensitivity_value.setText(f"{percentage}%")
         
-        self.update_status(f"Microphone sensitivity set to {sensitivity:.3f}")
+        if self.pending_slider_status:
+            self.update_status(self.pending_slider_status)
+            self.pending_slider_status = None
     
     def closeEvent(self, event):
         if self.audio_thread and self.audio_thread.isRunning():
@@ -974,6 +1130,7 @@ class SpeechToTextApp(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(SpeechToTextApp.APP_STYLE)
     window = SpeechToTextApp()
     window.show()
     sys.exit(app.exec_()) 
\ No newline at end of file